@@ -20,16 +20,22 @@ def parse_frontmatter(content: str) -> dict:
             fm[k.strip()] = v.strip()
     return fm
 
-def count_lines(path: Path) -> int:
-    return len(path.read_text().splitlines()) if path.exists() else 0
-
 def analyze(skill_path: Path) -> dict:
     skill_md = skill_path / "SKILL.md"
     if not skill_md.exists():
         return {"error": "SKILL.md not found", "score": 0}
+    if skill_md.stat().st_size == 0:
+        return {"error": "SKILL.md is empty", "score": 0}
 
     content = skill_md.read_text()
     fm = parse_frontmatter(content)
+    if not fm:  # Nothing to score; skip the content scans and resource lookups
+        return {
+            "name": skill_path.name,
+            "scores": {k: 0 for k in ("clarity", "specificity", "actionability", "automation")},
+            "total": 0, "grade": "D",
+            "issues": ["No frontmatter"], "recommendations": []
+        }
     issues, recs = [], []
 
     # Clarity (25%) - description quality, trigger keywords
@@ -46,7 +52,7 @@ def analyze(skill_path: Path) -> dict:
         if any(k in desc.lower() for k in ['when', 'trigger', '때', '경우']): clarity += 1
 
     # Specificity (25%) - structure, examples, references
-    lines = count_lines(skill_md)
+    lines = len(content.splitlines())  # Reuse content; no second read
     specificity = 6
     if lines <= 200: specificity += 1
     if lines > 200: issues.append(f"SKILL.md: {lines} lines (>200)")
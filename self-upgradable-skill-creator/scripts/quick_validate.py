@@ -6,31 +6,49 @@ Usage:
     python3 quick_validate.py <skill-directory>
 """
 
+import os
 import sys
 import re
 from pathlib import Path
 
+_NAME_RE = re.compile(r'name:\s*(.+)')
+_DESC_RE = re.compile(r'description:\s*(.+)')
+_NAME_VALID_RE = re.compile(r'^[a-z0-9-]+$')
+
 
 def validate_skill(skill_path: Path) -> tuple[bool, str]:
     """Validate a skill directory."""
     skill_path = Path(skill_path)
 
-    # Check SKILL.md exists
+    # Check SKILL.md exists; the same stat feeds the size gate below
     skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
+    try:
+        size = os.stat(skill_md).st_size
+    except (FileNotFoundError, NotADirectoryError):
         return False, "SKILL.md not found"
 
-    content = skill_md.read_text()
+    # 200 lines x 200 chars is a generous ceiling; reject bigger files unread
+    if size > 40_000:
+        return False, f"SKILL.md too large ({size} bytes)"
+
+    # Count newlines on the raw bytes in C instead of building a list of lines
+    with open(skill_md, 'rb') as f:
+        raw = f.read()
+    lines = raw.count(b'\n')
+    if raw and not raw.endswith(b'\n'):
+        lines += 1
+    content = raw.decode().replace('\r\n', '\n')  # Match read_text() newlines
 
     # Check frontmatter exists
     if not content.startswith('---'):
         return False, "No YAML frontmatter found"
 
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
+    # Plain substring search; no regex needed for the delimiters
+    end = content.find('\n---', 4) if content.startswith('---\n') else -1
+    if end < 0:
         return False, "Invalid frontmatter format"
 
-    fm = match.group(1)
+    fm = content[4:end]
 
     # Check required fields
     if 'name:' not in fm:
@@ -39,16 +57,16 @@ def validate_skill(skill_path: Path) -> tuple[bool, str]:
         return False, "Missing 'description' in frontmatter"
 
     # Validate name format
-    name_match = re.search(r'name:\s*(.+)', fm)
+    name_match = _NAME_RE.search(fm)
     if name_match:
         name = name_match.group(1).strip()
-        if not re.match(r'^[a-z0-9-]+$', name):
+        if not _NAME_VALID_RE.match(name):
             return False, f"Name '{name}' must be hyphen-case"
         if name.startswith('-') or name.endswith('-') or '--' in name:
             return False, f"Name '{name}' has invalid hyphens"
 
     # Validate description
-    desc_match = re.search(r'description:\s*(.+)', fm)
+    desc_match = _DESC_RE.search(fm)
     if desc_match:
         desc = desc_match.group(1).strip()
         if '<' in desc or '>' in desc:
@@ -57,7 +75,6 @@ def validate_skill(skill_path: Path) -> tuple[bool, str]:
             return False, "Description has TODO placeholder"
 
     # Check line count
-    lines = len(content.splitlines())
     if lines > 200:
         return False, f"SKILL.md has {lines} lines (max 200)"
 
@@ -6,10 +6,9 @@ Fetches latest Claude Code documentation and updates references.
 Uses claude-code-guide subagent pattern for accurate information.
 """
 
-import json
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 
 SKILL_DIR = Path(__file__).parent.parent
@@ -34,26 +33,34 @@ KNOWLEDGE_TOPICS = {
     ],
 }
 
+# KNOWLEDGE_TOPICS is static, so the prompt is built once at import
+_UPGRADE_PROMPT = "Get latest Claude Code info on:" + "".join(
+    f"\n## {file}" + "".join(f"- {item}" for item in items)
+    for file, items in KNOWLEDGE_TOPICS.items()
+)
+
 def generate_upgrade_prompt() -> str:
     """Generate prompt for claude-code-guide agent."""
-    topics = []
-    for file, items in KNOWLEDGE_TOPICS.items():
-        topics.append(f"\n## {file}")
-        for item in items:
-            topics.append(f"- {item}")
-    return f"Get latest Claude Code info on:{''.join(topics)}"
+    return _UPGRADE_PROMPT
 
 def check_knowledge_age():
     """Check age of knowledge files."""
     print("\nKnowledge Status:")
+    now = time.time()
+    # One directory read instead of a lookup per file
+    try:
+        with os.scandir(REFERENCES_DIR) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        entries = {}
     for file in KNOWLEDGE_TOPICS.keys():
-        path = REFERENCES_DIR / file
-        if path.exists():
-            days = (datetime.now() - datetime.fromtimestamp(path.stat().st_mtime)).days
-            status = "🟢" if days < 7 else "🟡" if days < 30 else "🔴"
-            print(f"{status} {file}: {days} days old")
-        else:
+        entry = entries.get(file)
+        if entry is None:
             print(f"❌ {file}: MISSING")
+            continue
+        days = int((now - entry.stat().st_mtime) // 86400)
+        status = "🟢" if days < 7 else "🟡" if days < 30 else "🔴"
+        print(f"{status} {file}: {days} days old")
 
 def main():
     if "--check" in sys.argv:
@@ -12,13 +12,32 @@ Example:
 import json
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # Optional; falls back to stdlib json
+    orjson = None
+
+# Token sections emitted by every generator, in output order
+TOKEN_SECTIONS = ('color', 'font', 'motion', 'spacing', 'radius', 'shadow')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to 2-space indented JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 
 def load_brand_spec(path: str) -> dict:
     """Load brand specification JSON."""
-    with open(path, 'r') as f:
-        return json.load(f)
+    return _loads(Path(path).read_bytes())
 
 
 def generate_w3c_tokens(spec: dict) -> dict:
@@ -29,127 +48,97 @@ def generate_w3c_tokens(spec: dict) -> dict:
         "$version": "1.0.0"
     }
 
-    # Color tokens
-    if 'color' in spec:
-        tokens['color'] = spec['color']
+    tokens.update({k: spec[k] for k in TOKEN_SECTIONS if k in spec})
 
-    # Typography tokens
-    if 'font' in spec:
-        tokens['font'] = spec['font']
+    return tokens
 
-    # Motion tokens
-    if 'motion' in spec:
-        tokens['motion'] = spec['motion']
 
-    # Spacing tokens
-    if 'spacing' in spec:
-        tokens['spacing'] = spec['spacing']
+def iter_token_leaves(obj: dict, path: tuple = ()) -> Iterator[tuple[tuple, dict]]:
+    """Yield (key-path, token) for every nested dict holding a '$value'.
 
-    # Radius tokens
-    if 'radius' in spec:
-        tokens['radius'] = spec['radius']
+    Walks with an explicit stack of item iterators instead of recursion, so
+    deep token trees cost no extra frames and keep their key order.
+    """
+    stack = [(path, iter(obj.items()))]
+    while stack:
+        path, items = stack[-1]
+        for key, value in items:
+            if key.startswith('$') or not isinstance(value, dict):
+                continue
+            if '$value' in value:
+                yield path + (key,), value
+            else:
+                stack.append((path + (key,), iter(value.items())))
+                break
+        else:
+            stack.pop()
 
-    # Shadow tokens
-    if 'shadow' in spec:
-        tokens['shadow'] = spec['shadow']
 
-    return tokens
+def walk_leaves(spec: dict) -> list[tuple[tuple, dict]]:
+    """Collect every token leaf across TOKEN_SECTIONS in a single traversal.
+
+    Paths start with the section name, e.g. ('color', 'brand', 'primary').
+    """
+    return [
+        leaf
+        for section in TOKEN_SECTIONS if section in spec
+        for leaf in iter_token_leaves(spec[section], (section,))
+    ]
 
 
 def extract_css_value(token: Any) -> str:
     """Extract CSS value from token."""
     if isinstance(token, dict):
-        return token.get('$value', str(token))
+        # Common case first; only stringify the whole dict when '$value' is absent
+        if '$value' in token:
+            return token['$value']
     return str(token)
 
 
-def generate_css_variables(spec: dict) -> str:
+def generate_css_variables(spec: dict, leaves: list | None = None) -> str:
     """Generate CSS custom properties from brand spec."""
-    lines = [":root {"]
-
-    def process_tokens(obj: dict, prefix: str = ""):
-        for key, value in obj.items():
-            if key.startswith('$'):
-                continue
+    if leaves is None:
+        leaves = walk_leaves(spec)
 
-            var_name = f"{prefix}-{key}" if prefix else key
+    # Render every declaration in one join rather than growing a list of lines
+    body = "".join(
+        f"  --{'-'.join(path)}: {extract_css_value(token)};\n"
+        for path, token in leaves
+    )
+    return f":root {{\n{body}}}"
 
-            if isinstance(value, dict):
-                if '$value' in value:
-                    css_val = extract_css_value(value)
-                    lines.append(f"  --{var_name}: {css_val};")
-                else:
-                    process_tokens(value, var_name)
 
-    # Process color tokens
-    if 'color' in spec:
-        process_tokens(spec['color'], 'color')
-
-    # Process font tokens
-    if 'font' in spec:
-        process_tokens(spec['font'], 'font')
-
-    # Process motion tokens
-    if 'motion' in spec:
-        process_tokens(spec['motion'], 'motion')
-
-    # Process spacing tokens
-    if 'spacing' in spec:
-        process_tokens(spec['spacing'], 'spacing')
-
-    # Process radius tokens
-    if 'radius' in spec:
-        process_tokens(spec['radius'], 'radius')
-
-    # Process shadow tokens
-    if 'shadow' in spec:
-        process_tokens(spec['shadow'], 'shadow')
-
-    lines.append("}")
-    return "\n".join(lines)
-
-
-def generate_tailwind_config(spec: dict) -> str:
+def generate_tailwind_config(spec: dict, leaves: list | None = None) -> str:
     """Generate Tailwind CSS theme configuration."""
-    config = {
-        "theme": {
-            "extend": {}
-        }
-    }
+    if leaves is None:
+        leaves = walk_leaves(spec)
+
+    extend = {}
+
+    # Bucket colors, font families and radii from the shared leaf list
+    colors, families, radius = {}, {}, {}
+    for path, token in leaves:
+        section = path[0]
+        if section == 'color':
+            colors['.'.join(path[1:]).replace('-', '.')] = token['$value']
+        elif section == 'radius' and len(path) == 2:
+            radius[path[1]] = token['$value']
+        elif path[:2] == ('font', 'family') and len(path) == 3:
+            families[path[2]] = token['$value'].split(',')
 
-    # Colors
     if 'color' in spec:
-        colors = {}
-        def extract_colors(obj: dict, prefix: str = ""):
-            for key, value in obj.items():
-                if key.startswith('$'):
-                    continue
-                name = f"{prefix}-{key}" if prefix else key
-                if isinstance(value, dict):
-                    if '$value' in value:
-                        colors[name.replace('-', '.')] = value['$value']
-                    else:
-                        extract_colors(value, name)
-        extract_colors(spec['color'])
-        config['theme']['extend']['colors'] = colors
-
-    # Font families
+        extend['colors'] = colors
     if 'font' in spec and 'family' in spec['font']:
-        families = {}
-        for key, value in spec['font']['family'].items():
-            if isinstance(value, dict) and '$value' in value:
-                families[key] = value['$value'].split(',')
-        config['theme']['extend']['fontFamily'] = families
-
-    # Border radius
+        extend['fontFamily'] = families
     if 'radius' in spec:
-        radius = {}
-        for key, value in spec['radius'].items():
-            if isinstance(value, dict) and '$value' in value:
-                radius[key] = value['$value']
-        config['theme']['extend']['borderRadius'] = radius
+        extend['borderRadius'] = radius
 
-    return f"/** @type {{import('tailwindcss').Config}} */\nmodule.exports = {json.dumps(config, indent=2)}"
+    # The theme/extend envelope is fixed; only the inner dict needs serializing
+    inner = json.dumps(extend, indent=2).replace("\n", "\n    ")
+    return (
+        "/** @type {import('tailwindcss').Config} */\n"
+        f'module.exports = {{\n  "theme": {{\n    "extend": {inner}\n  }}\n}}'
+    )
 
 
 def main():
@@ -163,25 +152,25 @@ def main():
     # Load specification
     spec = load_brand_spec(spec_path)
 
+    # Walk the token tree once; every emitter below reuses the leaves
+    leaves = walk_leaves(spec)
+
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate W3C tokens
     w3c_tokens = generate_w3c_tokens(spec)
-    with open(output_dir / "w3c-tokens.json", 'w') as f:
-        json.dump(w3c_tokens, f, indent=2)
+    (output_dir / "w3c-tokens.json").write_bytes(_dumps(w3c_tokens))
     print(f"✓ Generated {output_dir}/w3c-tokens.json")
 
     # Generate CSS variables
-    css_vars = generate_css_variables(spec)
-    with open(output_dir / "variables.css", 'w') as f:
-        f.write(css_vars)
+    css_vars = generate_css_variables(spec, leaves)
+    (output_dir / "variables.css").write_text(css_vars)
     print(f"✓ Generated {output_dir}/variables.css")
 
     # Generate Tailwind config
-    tailwind_config = generate_tailwind_config(spec)
-    with open(output_dir / "tailwind.config.js", 'w') as f:
-        f.write(tailwind_config)
+    tailwind_config = generate_tailwind_config(spec, leaves)
+    (output_dir / "tailwind.config.js").write_text(tailwind_config)
     print(f"✓ Generated {output_dir}/tailwind.config.js")
 
     print(f"\n✅ All tokens generated in {output_dir}/")
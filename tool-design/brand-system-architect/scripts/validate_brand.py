@@ -15,12 +15,36 @@ import re
 from pathlib import Path
 from typing import Any
 
+_HEX_CHARS = frozenset('0123456789abcdefABCDEF')
+_BEZIER_RE = re.compile(r'cubic-bezier\([0-9.]+,\s*[0-9.]+,\s*[0-9.]+,\s*[0-9.]+\)')
+
+_HEADER_BYTES = ("=" * 50 + "\nBrand Specification Validation Report\n" + "=" * 50 + "\n\n").encode()
+_BULLET_BYTES = "   • ".encode()
+
+
+def _is_hex_color(value: str) -> bool:
+    """Check for '#RRGGBB' without going through the regex engine."""
+    return len(value) == 7 and value[0] == '#' and _HEX_CHARS.issuperset(value[1:])
+
 
 class BrandValidator:
     def __init__(self, spec: dict):
         self.spec = spec
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        # Report bodies are encoded as findings arrive, so report() only stitches
+        self._error_buf = bytearray()
+        self._warning_buf = bytearray()
+
+    def _error(self, msg: str):
+        """Record an error and its report line."""
+        self.errors.append(msg)
+        self._error_buf += _BULLET_BYTES + msg.encode() + b"\n"
+
+    def _warn(self, msg: str):
+        """Record a warning and its report line."""
+        self.warnings.append(msg)
+        self._warning_buf += _BULLET_BYTES + msg.encode() + b"\n"
 
     def validate(self) -> bool:
         """Run all validations."""
@@ -37,7 +61,7 @@ class BrandValidator:
         required = ['color', 'font', 'motion', 'spacing']
         for section in required:
             if section not in self.spec:
-                self.errors.append(f"Missing required section: {section}")
+                self._error(f"Missing required section: {section}")
 
     def _validate_colors(self):
         """Validate color tokens."""
@@ -45,9 +69,9 @@ class BrandValidator:
 
         # Check for brand colors
         if 'brand' not in colors:
-            self.errors.append("Missing color.brand section")
+            self._error("Missing color.brand section")
         elif 'primary' not in colors.get('brand', {}):
-            self.errors.append("Missing color.brand.primary")
+            self._error("Missing color.brand.primary")
 
         # Validate hex format
         def check_hex(obj: dict, path: str = ""):
@@ -58,9 +82,9 @@ class BrandValidator:
                 if isinstance(value, dict):
                     if '$value' in value:
                         hex_val = value['$value']
-                        if not re.match(r'^#[0-9A-Fa-f]{6}$', str(hex_val)):
+                        if not _is_hex_color(str(hex_val)):
                             if value.get('$type') == 'color':
-                                self.warnings.append(f"Invalid hex at {current_path}: {hex_val}")
+                                self._warn(f"Invalid hex at {current_path}: {hex_val}")
                     else:
                         check_hex(value, current_path)
 
@@ -71,22 +95,22 @@ class BrandValidator:
         font = self.spec.get('font', {})
 
         if 'family' not in font:
-            self.errors.append("Missing font.family section")
+            self._error("Missing font.family section")
 
         if 'size' not in font:
-            self.errors.append("Missing font.size section")
+            self._error("Missing font.size section")
         elif 'base' not in font.get('size', {}):
-            self.warnings.append("Missing font.size.base - recommended for type scale")
+            self._warn("Missing font.size.base - recommended for type scale")
 
     def _validate_motion(self):
         """Validate motion tokens."""
         motion = self.spec.get('motion', {})
 
         if 'duration' not in motion:
-            self.warnings.append("Missing motion.duration section")
+            self._warn("Missing motion.duration section")
 
         if 'easing' not in motion:
-            self.warnings.append("Missing motion.easing section")
+            self._warn("Missing motion.easing section")
 
         # Validate cubic-bezier format
         easing = motion.get('easing', {})
@@ -95,8 +119,8 @@ class BrandValidator:
                 bezier = value['$value']
                 if 'cubic-bezier' in str(bezier):
                     # Basic format check
-                    if not re.match(r'cubic-bezier\([0-9.]+,\s*[0-9.]+,\s*[0-9.]+,\s*[0-9.]+\)', bezier):
-                        self.warnings.append(f"Invalid cubic-bezier at motion.easing.{key}")
+                    if not _BEZIER_RE.match(bezier):
+                        self._warn(f"Invalid cubic-bezier at motion.easing.{key}")
 
     def _validate_accessibility(self):
         """Validate accessibility requirements."""
@@ -104,12 +128,12 @@ class BrandValidator:
 
         # Check for semantic colors
         if 'semantic' not in colors:
-            self.warnings.append("Missing color.semantic (success, warning, error, info)")
+            self._warn("Missing color.semantic (success, warning, error, info)")
 
         # Check for contrast ratios
         accessibility = self.spec.get('accessibility', colors.get('accessibility', {}))
         if not accessibility:
-            self.warnings.append("No accessibility/contrast data found - WCAG compliance unverified")
+            self._warn("No accessibility/contrast data found - WCAG compliance unverified")
 
     def _validate_ai_integration(self):
         """Validate AI integration sections."""
@@ -118,36 +142,32 @@ class BrandValidator:
 
         if voice:
             if 'ai_config' not in voice:
-                self.warnings.append("Missing voice.ai_config for chatbot integration")
+                self._warn("Missing voice.ai_config for chatbot integration")
 
         if imagery:
             if 'ai_generation' not in imagery:
-                self.warnings.append("Missing imagery.ai_generation for image generation prompts")
+                self._warn("Missing imagery.ai_generation for image generation prompts")
 
     def report(self) -> str:
         """Generate validation report."""
-        lines = ["=" * 50, "Brand Specification Validation Report", "=" * 50, ""]
+        buf = bytearray(_HEADER_BYTES)
 
         if self.errors:
-            lines.append(f"❌ ERRORS ({len(self.errors)}):")
-            for error in self.errors:
-                lines.append(f"   • {error}")
-            lines.append("")
+            buf += f"❌ ERRORS ({len(self.errors)}):\n".encode()
+            buf += self._error_buf + b"\n"
 
         if self.warnings:
-            lines.append(f"⚠️  WARNINGS ({len(self.warnings)}):")
-            for warning in self.warnings:
-                lines.append(f"   • {warning}")
-            lines.append("")
+            buf += f"⚠️  WARNINGS ({len(self.warnings)}):\n".encode()
+            buf += self._warning_buf + b"\n"
 
         if not self.errors and not self.warnings:
-            lines.append("✅ All validations passed!")
+            buf += "✅ All validations passed!".encode()
         elif not self.errors:
-            lines.append("✅ Validation passed with warnings")
+            buf += "✅ Validation passed with warnings".encode()
         else:
-            lines.append("❌ Validation failed - fix errors before proceeding")
+            buf += "❌ Validation failed - fix errors before proceeding".encode()
 
-        return "\n".join(lines)
+        return buf.decode()
 
 
 def main():
@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -27,6 +28,7 @@ class SearchResult:
     context_after: list
 
 
+@functools.lru_cache(maxsize=8)
 def get_docs_path(base_path: str = ".") -> Path:
     return Path(base_path) / WIREFRAME_DOCS_DIR
 
@@ -7,95 +7,183 @@ Usage:
     python3 task_tracker.py status
     python3 task_tracker.py next
     python3 task_tracker.py update --task TASK-001 --status completed
+    python3 task_tracker.py update --task TASK-001,TASK-002 --status completed
     python3 task_tracker.py verify --task TASK-001
 """
 
-import argparse
+import functools
 import json
-from datetime import datetime
+import os
+import re
+import sys
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to stdlib json
+    orjson = None
+
 
 WIREFRAME_DOCS_DIR = ".wireframe-docs"
 
+_CHECKBOX_RE = re.compile(r"\[([x ])\]")
+
+TASK_STATUSES = ("pending", "in_progress", "completed")
+
+# Every possible 20-slot progress bar, indexed by filled slots
+_BARS = tuple(f"[{'=' * i}{'.' * (20 - i)}]" for i in range(21))
+
+# Pinned once per CLI invocation by main(); library callers get a fresh time
+_NOW: Optional[str] = None
+
+
+def _now_iso() -> str:
+    """Current ISO timestamp, reused across a single command."""
+    if _NOW:
+        return _NOW
+    from datetime import datetime
+    return datetime.now().isoformat()
+
 
+@functools.lru_cache(maxsize=8)
 def get_docs_path(base_path: str = ".") -> Path:
     return Path(base_path) / WIREFRAME_DOCS_DIR
 
 
+# Directories already created by this process; skips repeat mkdir syscalls
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _dump_compact(obj) -> bytes:
+    """Serialize machine-read tracking files without indentation whitespace."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _load_json(path: Path):
+    """Parse a tracking file, using orjson when available."""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 def load_status(base_path: str = ".") -> dict:
     """Load completion status."""
     status_path = get_docs_path(base_path) / "tracking" / "completion_status.json"
     if status_path.exists():
-        with open(status_path) as f:
-            return json.load(f)
+        return _load_json(status_path)
     return {"tasks": {}, "summary": {"total_tasks": 0, "completed": 0, "in_progress": 0, "pending": 0}}
 
 
 def save_status(status: dict, base_path: str = "."):
     """Save completion status."""
     status_path = get_docs_path(base_path) / "tracking" / "completion_status.json"
-    status_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(status_path, "w") as f:
-        json.dump(status, f, indent=2)
+    _ensure_dir(status_path.parent)
+    status_path.write_bytes(_dump_compact(status))
 
 
-def update_task_status(task_id: str, new_status: str, base_path: str = ".") -> dict:
-    """Update status for a specific task."""
-    status = load_status(base_path)
+def summarize_tasks(tasks: dict) -> dict:
+    """Recount the summary from scratch."""
+    counts = Counter(t.get("status", "pending") for t in tasks.values())
+    return {
+        "total_tasks": len(tasks),
+        "completed": counts["completed"],
+        "in_progress": counts["in_progress"],
+        "pending": counts["pending"]
+    }
 
-    if task_id not in status["tasks"]:
-        status["tasks"][task_id] = {}
 
-    status["tasks"][task_id]["status"] = new_status
-    status["tasks"][task_id]["updated_at"] = datetime.now().isoformat()
+def _apply_status(status: dict, task_id: str, new_status: str, now: str) -> None:
+    """Set one task's status in a loaded status dict, adjusting the summary."""
+    # The stored summary is authoritative; adjust it by delta instead of rescanning
+    if "summary" not in status:
+        status["summary"] = summarize_tasks(status["tasks"])
+    summary = status["summary"]
+
+    tasks = status["tasks"]
+    known = len(tasks)
+    task = tasks.setdefault(task_id, {})
+    if len(tasks) != known:
+        summary["total_tasks"] += 1
+    else:
+        old_status = task.get("status", "pending")
+        if old_status in summary:
+            summary[old_status] -= 1
+    if new_status in summary:
+        summary[new_status] += 1
+
+    task["status"] = new_status
+    task["updated_at"] = now
 
     if new_status == "in_progress":
-        status["tasks"][task_id]["started_at"] = datetime.now().isoformat()
+        task["started_at"] = now
     elif new_status == "completed":
-        status["tasks"][task_id]["completed_at"] = datetime.now().isoformat()
-
-    # Update summary
-    statuses = [t.get("status", "pending") for t in status["tasks"].values()]
-    status["summary"] = {
-        "total_tasks": len(statuses),
-        "completed": statuses.count("completed"),
-        "in_progress": statuses.count("in_progress"),
-        "pending": statuses.count("pending")
-    }
-    status["last_updated"] = datetime.now().isoformat()
+        task["completed_at"] = now
+
+
+def update_task_status(task_id: str, new_status: str, base_path: str = ".") -> dict:
+    """Update status for a specific task."""
+    status = load_status(base_path)
+
+    now = _now_iso()
+    _apply_status(status, task_id, new_status, now)
+    status["last_updated"] = now
 
     save_status(status, base_path)
     return {"task_id": task_id, "status": new_status, "summary": status["summary"]}
 
 
-def get_next_task(base_path: str = ".") -> Optional[dict]:
-    """Get next pending task."""
+def update_task_statuses(task_ids: list, new_status: str, base_path: str = ".") -> dict:
+    """Update several tasks to the same status with one load and one save."""
     status = load_status(base_path)
+
+    now = _now_iso()
+    for task_id in task_ids:
+        _apply_status(status, task_id, new_status, now)
+    status["last_updated"] = now
+
+    save_status(status, base_path)
+    return {"task_ids": list(task_ids), "status": new_status, "summary": status["summary"]}
+
+
+def get_next_task(base_path: str = ".", status: Optional[dict] = None) -> Optional[dict]:
+    """Get next pending task."""
+    if status is None:
+        status = load_status(base_path)
     tasks_dir = get_docs_path(base_path) / "tasks"
 
     if not tasks_dir.exists():
         return None
 
-    task_files = sorted(tasks_dir.glob("TASK-*.md"))
+    # Sort plain names and only build a Path for the task we return
+    with os.scandir(tasks_dir) as it:
+        names = sorted(e.name for e in it if e.name.startswith("TASK-") and e.name.endswith(".md"))
 
-    for task_file in task_files:
-        task_id = task_file.stem
+    for name in names:
+        task_id = name[:-3]
         task_status = status["tasks"].get(task_id, {}).get("status", "pending")
         if task_status == "pending":
             return {
                 "task_id": task_id,
-                "file": str(task_file),
+                "file": str(tasks_dir / name),
                 "status": task_status
             }
 
     return None
 
 
-def get_current_task(base_path: str = ".") -> Optional[dict]:
+def get_current_task(base_path: str = ".", status: Optional[dict] = None) -> Optional[dict]:
     """Get current in-progress task."""
-    status = load_status(base_path)
+    if status is None:
+        status = load_status(base_path)
 
     for task_id, task_data in status["tasks"].items():
         if task_data.get("status") == "in_progress":
@@ -111,12 +199,12 @@ def verify_task(task_id: str, base_path: str = ".") -> dict:
     if not task_path.exists():
         return {"passed": False, "message": f"Task file not found: {task_id}"}
 
-    with open(task_path) as f:
-        content = f.read()
+    content = task_path.read_text()
 
     # Check acceptance criteria
-    criteria_checked = content.count("[x]")
-    criteria_total = content.count("[ ]") + criteria_checked
+    marks = _CHECKBOX_RE.findall(content)  # One scan for both checkbox states
+    criteria_checked = marks.count("x")
+    criteria_total = len(marks)
 
     passed = criteria_total > 0 and criteria_checked == criteria_total
 
@@ -140,10 +228,12 @@ def generate_status_report(base_path: str = ".") -> str:
     pending = summary.get("pending", 0)
 
     progress_pct = (completed / total * 100) if total > 0 else 0
+    pct_str = f"{progress_pct:.1f}"
+    bar = _BARS[min(20, int(progress_pct // 5))]
 
-    report = f"""# Wireframe Implementation Status
+    parts = [f"""# Wireframe Implementation Status
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+**Generated:** {_now_iso()[:16].replace('T', ' ')}
 
 ## Progress
 
@@ -154,35 +244,78 @@ def generate_status_report(base_path: str = ".") -> str:
 | In Progress | {in_progress} |
 | Pending     | {pending} |
 
-**Progress:** {progress_pct:.1f}%
+**Progress:** {pct_str}%
 
 ```
-[{'=' * int(progress_pct / 5)}{'.' * (20 - int(progress_pct / 5))}] {progress_pct:.1f}%
+{bar} {pct_str}%
 ```
 
 ## Task Details
 
-"""
+"""]
 
     for task_id, task_data in sorted(status.get("tasks", {}).items()):
         task_status = task_data.get("status", "pending")
         icon = {"completed": "[x]", "in_progress": "[-]", "pending": "[ ]"}.get(task_status, "[ ]")
-        report += f"- {icon} **{task_id}**: {task_status}\n"
+        parts.append(f"- {icon} **{task_id}**: {task_status}\n")
 
-    current = get_current_task(base_path)
+    current = get_current_task(base_path, status)
     if current:
-        report += f"\n## Current Task\n\n**{current['task_id']}** (in progress)\n"
+        parts.append(f"\n## Current Task\n\n**{current['task_id']}** (in progress)\n")
 
-    next_task = get_next_task(base_path)
+    next_task = get_next_task(base_path, status)
     if next_task:
-        report += f"\n## Next Task\n\n**{next_task['task_id']}** is ready to start.\n"
+        parts.append(f"\n## Next Task\n\n**{next_task['task_id']}** is ready to start.\n")
     elif completed == total and total > 0:
-        report += "\n## Status\n\nAll tasks completed!\n"
+        parts.append("\n## Status\n\nAll tasks completed!\n")
+
+    return "".join(parts)
 
-    return report
+
+def _split_task_ids(value: str) -> list:
+    """Split a comma-separated --task value, ignoring empty pieces."""
+    return [t.strip() for t in value.split(",") if t.strip()]
+
+
+def _task_ids_arg(value: str) -> list:
+    """argparse type for --task; rejects values with no task IDs."""
+    task_ids = _split_task_ids(value)
+    if not task_ids:
+        import argparse
+        raise argparse.ArgumentTypeError(f"no task IDs in {value!r}")
+    return task_ids
+
+
+def _parse_update_fast(argv: list) -> Optional[dict]:
+    """Hand-parse `update --task ID --status S [--path P]`; None defers to argparse."""
+    if len(argv) not in (5, 7) or argv[0] != "update":
+        return None
+    opts = dict(zip(argv[1::2], argv[2::2]))
+    if (set(opts) - {"--task", "--status", "--path"} or "--task" not in opts
+            or opts.get("--status") not in TASK_STATUSES or not _split_task_ids(opts["--task"])):
+        return None
+    return opts
+
+
+def _print_update(task_ids: list, new_status: str, base_path: str) -> None:
+    if len(task_ids) == 1:
+        result = update_task_status(task_ids[0], new_status, base_path)
+    else:
+        result = update_task_statuses(task_ids, new_status, base_path)
+    print(json.dumps(result, indent=2))
 
 
 def main():
+    global _NOW
+    _NOW = _now_iso()
+
+    # `update` runs in tight agent loops; skip importing and building argparse for it
+    opts = _parse_update_fast(sys.argv[1:])
+    if opts:
+        _print_update(_split_task_ids(opts["--task"]), opts["--status"], opts.get("--path", "."))
+        return
+
+    import argparse
     parser = argparse.ArgumentParser(description="Track wireframe tasks")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -197,8 +330,9 @@ def main():
     current_parser.add_argument("--path", default=".", help="Base path")
 
     update_parser = subparsers.add_parser("update", help="Update task status")
-    update_parser.add_argument("--task", required=True, help="Task ID")
-    update_parser.add_argument("--status", required=True, choices=["pending", "in_progress", "completed"])
+    update_parser.add_argument("--task", required=True, type=_task_ids_arg,
+                               help="Task ID, or comma-separated IDs")
+    update_parser.add_argument("--status", required=True, choices=TASK_STATUSES)
     update_parser.add_argument("--path", default=".", help="Base path")
 
     verify_parser = subparsers.add_parser("verify", help="Verify task completion")
@@ -225,8 +359,7 @@ def main():
         else:
             print("No task in progress")
     elif args.command == "update":
-        result = update_task_status(args.task, args.status, args.path)
-        print(json.dumps(result, indent=2))
+        _print_update(args.task, args.status, args.path)
     elif args.command == "verify":
         result = verify_task(args.task, args.path)
         print(json.dumps(result, indent=2))
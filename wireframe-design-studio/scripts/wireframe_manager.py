@@ -11,22 +11,102 @@ Usage:
 """
 
 import argparse
+import asyncio
+import functools
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to stdlib json
+    orjson = None
+
 
 WIREFRAME_DOCS_DIR = ".wireframe-docs"
 
+# Pinned once per CLI invocation by main(); library callers get a fresh time
+_NOW: Optional[str] = None
+
+
+def _now_iso() -> str:
+    """Current ISO timestamp, reused across a single command."""
+    return _NOW or datetime.now().isoformat()
+
 
+@functools.lru_cache(maxsize=8)
 def get_docs_path(base_path: str = ".") -> Path:
     """Get the .wireframe-docs directory path."""
     return Path(base_path) / WIREFRAME_DOCS_DIR
 
 
+# Directories already created by this process; skips repeat mkdir syscalls
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _write_json(path: Path, obj) -> None:
+    path.write_text(json.dumps(obj, indent=2))
+
+
+def _dump_compact(obj) -> bytes:
+    """Serialize machine-read tracking files without indentation whitespace."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _load_json(path: Path):
+    """Parse a tracking file, using orjson when available."""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 def init_structure(project_name: str, base_path: str = ".") -> dict:
-    """Initialize .wireframe-docs directory structure."""
+    """Initialize .wireframe-docs directory structure.
+
+    The seed files are written concurrently via asyncio.run. That cannot
+    nest, so when this thread already runs an event loop they are written
+    one after another instead; async callers can await init_structure_async.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(init_structure_async(project_name, base_path))
+
+    docs, directories, writes = _init_plan(project_name, base_path)
+    for dir_path in directories:
+        dir_path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.update(directories)
+    for write, *args in writes:
+        write(*args)
+
+    return {"status": "initialized", "path": str(docs), "project": project_name}
+
+
+async def init_structure_async(project_name: str, base_path: str = ".") -> dict:
+    """Create the directories, then write the four seed files concurrently."""
+    docs, directories, writes = _init_plan(project_name, base_path)
+
+    await asyncio.gather(*(
+        asyncio.to_thread(dir_path.mkdir, parents=True, exist_ok=True)
+        for dir_path in directories
+    ))
+    _ENSURED_DIRS.update(directories)
+
+    await asyncio.gather(*(asyncio.to_thread(write, *args) for write, *args in writes))
+
+    return {"status": "initialized", "path": str(docs), "project": project_name}
+
+
+def _init_plan(project_name: str, base_path: str) -> tuple:
+    """Directories and (write, *args) seed file writes for a new docs tree."""
     docs = get_docs_path(base_path)
 
     directories = [
@@ -38,12 +118,9 @@ def init_structure(project_name: str, base_path: str = ".") -> dict:
         docs / "tracking"
     ]
 
-    for dir_path in directories:
-        dir_path.mkdir(parents=True, exist_ok=True)
-
     config = {
         "project": project_name,
-        "created_at": datetime.now().isoformat(),
+        "created_at": _now_iso(),
         "phases": {
             "discover": "pending",
             "design": "pending",
@@ -55,34 +132,29 @@ def init_structure(project_name: str, base_path: str = ".") -> dict:
     }
 
     config_path = docs / "config.json"
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
 
     registry = {
         "project": project_name,
         "wireframes": [],
-        "last_updated": datetime.now().isoformat()
+        "by_screen": {},
+        "last_updated": _now_iso()
     }
 
     registry_path = docs / "tracking" / "wireframe_registry.json"
-    with open(registry_path, "w") as f:
-        json.dump(registry, f, indent=2)
 
     status = {
         "project": project_name,
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": _now_iso(),
         "summary": {"total_tasks": 0, "completed": 0, "in_progress": 0, "pending": 0},
         "tasks": {}
     }
 
     status_path = docs / "tracking" / "completion_status.json"
-    with open(status_path, "w") as f:
-        json.dump(status, f, indent=2)
 
     index_content = f"""# Wireframe Documentation Index
 
 **Project:** {project_name}
-**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+**Created:** {_now_iso()[:16].replace('T', ' ')}
 
 ## Phases
 
@@ -103,27 +175,35 @@ def init_structure(project_name: str, base_path: str = ".") -> dict:
 """
 
     index_path = docs / "index.md"
-    with open(index_path, "w") as f:
-        f.write(index_content)
 
-    return {"status": "initialized", "path": str(docs), "project": project_name}
+    writes = [
+        (_write_json, config_path, config),
+        (registry_path.write_bytes, _dump_compact(registry)),
+        (status_path.write_bytes, _dump_compact(status)),
+        (index_path.write_text, index_content),
+    ]
+
+    return docs, directories, writes
+
+
+def _load_registry(base_path: str = ".") -> dict:
+    """Load the wireframe registry."""
+    registry_path = get_docs_path(base_path) / "tracking" / "wireframe_registry.json"
+    if registry_path.exists():
+        return _load_json(registry_path)
+    return {"wireframes": []}
 
 
 def register_wireframe(screen_name: str, wireframe_type: str, base_path: str = ".") -> dict:
     """Register a new wireframe in the registry."""
     registry_path = get_docs_path(base_path) / "tracking" / "wireframe_registry.json"
-
-    if registry_path.exists():
-        with open(registry_path) as f:
-            registry = json.load(f)
-    else:
-        registry = {"wireframes": []}
+    registry = _load_registry(base_path)
 
     wireframe = {
         "id": f"WF-{len(registry['wireframes']) + 1:03d}",
         "screen": screen_name,
         "type": wireframe_type,
-        "created_at": datetime.now().isoformat(),
+        "created_at": _now_iso(),
         "status": "draft",
         "files": {
             "layout": f"designs/{screen_name}/layout.md",
@@ -135,37 +215,49 @@ def register_wireframe(screen_name: str, wireframe_type: str, base_path: str = "
         }
     }
 
+    by_screen = registry.get("by_screen")
+    if by_screen is None:  # Backfill the index for registries written without it
+        by_screen = registry["by_screen"] = {}
+        for wf in registry["wireframes"]:
+            by_screen.setdefault(wf["screen"], wf["id"])
+
     registry["wireframes"].append(wireframe)
-    registry["last_updated"] = datetime.now().isoformat()
+    # First registration of a screen wins, matching the old linear lookup
+    by_screen.setdefault(screen_name, wireframe["id"])
+    registry["last_updated"] = _now_iso()
 
-    with open(registry_path, "w") as f:
-        json.dump(registry, f, indent=2)
+    registry_path.write_bytes(_dump_compact(registry))
 
     # Create screen directories
     docs = get_docs_path(base_path)
-    (docs / "designs" / screen_name).mkdir(parents=True, exist_ok=True)
-    (docs / "specs" / screen_name).mkdir(parents=True, exist_ok=True)
+    _ensure_dir(docs / "designs" / screen_name)
+    _ensure_dir(docs / "specs" / screen_name)
 
     return wireframe
 
 
 def list_wireframes(base_path: str = ".") -> list:
     """List all registered wireframes."""
-    registry_path = get_docs_path(base_path) / "tracking" / "wireframe_registry.json"
-
-    if not registry_path.exists():
-        return []
-
-    with open(registry_path) as f:
-        registry = json.load(f)
-
-    return registry.get("wireframes", [])
+    return _load_registry(base_path).get("wireframes", [])
 
 
 def get_wireframe(screen_name: str, base_path: str = ".") -> Optional[dict]:
     """Get wireframe by screen name."""
-    wireframes = list_wireframes(base_path)
-
+    registry = _load_registry(base_path)
+    wireframes = registry.get("wireframes", [])
+
+    by_screen = registry.get("by_screen")
+    if by_screen is not None:
+        wf_id = by_screen.get(screen_name)
+        if wf_id is None:
+            return None
+        # IDs are assigned as WF-<position + 1>, so try that slot before scanning
+        idx = int(wf_id[3:]) - 1
+        if 0 <= idx < len(wireframes) and wireframes[idx]["id"] == wf_id:
+            return wireframes[idx]
+        return next((wf for wf in wireframes if wf["id"] == wf_id), None)
+
+    # Registries written before the index existed
     for wf in wireframes:
         if wf["screen"] == screen_name:
             return wf
@@ -173,46 +265,73 @@ def get_wireframe(screen_name: str, base_path: str = ".") -> Optional[dict]:
     return None
 
 
-def save_document(phase: str, screen: str, filename: str, content: str, base_path: str = ".") -> dict:
-    """Save a document to the appropriate directory."""
+def _document_target(phase: str, screen: str, filename: str, base_path: str) -> Path:
+    """Resolve where a document for the given phase lives."""
     docs = get_docs_path(base_path)
 
     if phase == "discovery":
-        target = docs / "discovery" / filename
+        return docs / "discovery" / filename
     elif phase == "design":
-        target = docs / "designs" / screen / filename
+        return docs / "designs" / screen / filename
     elif phase == "spec":
-        target = docs / "specs" / screen / filename
+        return docs / "specs" / screen / filename
     elif phase == "task":
-        target = docs / "tasks" / filename
+        return docs / "tasks" / filename
     else:
         raise ValueError(f"Unknown phase: {phase}")
 
-    target.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(target, "w") as f:
-        f.write(content)
+def save_document(phase: str, screen: str, filename: str, content: str, base_path: str = ".") -> dict:
+    """Save a document to the appropriate directory."""
+    target = _document_target(phase, screen, filename, base_path)
+
+    _ensure_dir(target.parent)
+
+    target.write_text(content)
 
     return {"status": "saved", "path": str(target), "size": len(content)}
 
 
+async def save_document_async(phase: str, screen: str, filename: str, content: str, base_path: str = ".") -> dict:
+    """Save a document without blocking the event loop."""
+    target = _document_target(phase, screen, filename, base_path)
+
+    if target.parent not in _ENSURED_DIRS:
+        await asyncio.to_thread(target.parent.mkdir, parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(target.parent)
+
+    await asyncio.to_thread(target.write_text, content)
+
+    return {"status": "saved", "path": str(target), "size": len(content)}
+
+
+async def save_many(items: list) -> list:
+    """Save several documents concurrently; each item holds save_document kwargs."""
+    return await asyncio.gather(*(save_document_async(**item) for item in items))
+
+
 def format_wireframes_list(wireframes: list) -> str:
     """Format wireframes list as markdown."""
     if not wireframes:
         return "No wireframes found."
 
-    output = "# Wireframe Registry\n\n"
-    output += "| ID | Screen | Type | Status | Created |\n"
-    output += "|----|--------|------|--------|--------|\n"
+    parts = [
+        "# Wireframe Registry\n\n",
+        "| ID | Screen | Type | Status | Created |\n",
+        "|----|--------|------|--------|--------|\n",
+    ]
 
     for wf in wireframes:
         created = wf["created_at"][:10]
-        output += f"| {wf['id']} | {wf['screen']} | {wf['type']} | {wf['status']} | {created} |\n"
+        parts.append(f"| {wf['id']} | {wf['screen']} | {wf['type']} | {wf['status']} | {created} |\n")
 
-    return output
+    return "".join(parts)
 
 
 def main():
+    global _NOW
+    _NOW = datetime.now().isoformat()
+
     parser = argparse.ArgumentParser(description="Manage wireframe documentation")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
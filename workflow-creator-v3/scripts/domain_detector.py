@@ -5,19 +5,35 @@ Domain Detection Module for Workflow Creator V3
 Classifies user requests into domain categories for specialized processing.
 """
 
-import re
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+import bisect
+import functools
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
 
+try:
+    import ahocorasick
+except ImportError:  # Optional; falls back to per-keyword substring checks
+    ahocorasick = None
 
-@dataclass
-class DomainResult:
+
+class DomainResult(NamedTuple):
     """Result of domain detection"""
     domain: str
     confidence: float
     complexity: int
-    keywords_matched: List[str]
-    suggested_tools: List[str]
+    keywords_matched: Tuple[str, ...]
+    suggested_tools: Tuple[str, ...]
+
+
+def _build_automaton(keywords: Iterable[str]):
+    """Build one Aho-Corasick automaton over every domain keyword"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
 
 
 class DomainDetector:
@@ -96,42 +112,81 @@ class DomainDetector:
         """
 
         request_lower = request.lower()
+        return self._classify(request, request_lower, self._find_keywords(request_lower))
+
+    def detect_batch(self, requests: List[str]) -> List[DomainResult]:
+        """
+        Detect domain and complexity for many requests at once
+
+        With pyahocorasick, keywords are matched in one automaton pass over
+        the whole batch, joined by a separator no keyword contains, and each
+        hit is assigned back to its request by offset.
+
+        Args:
+            requests: User workflow creation requests
+
+        Returns:
+            One DomainResult per request, in order
+        """
+
+        automaton = self._keyword_automaton()
+        if automaton is None:
+            # Substring checks cost the same per character joined or not
+            return [self.detect(request) for request in requests]
+
+        lowered = [request.lower() for request in requests]
+
+        starts = []
+        offset = 0
+        for request_lower in lowered:
+            starts.append(offset)
+            offset += len(request_lower) + 1
+
+        found = [set() for _ in lowered]
+        for end, kw in automaton.iter('\x01'.join(lowered)):
+            found[bisect.bisect_right(starts, end) - 1].add(kw)
 
-        # Detect domain
-        domain_scores = {}
-        domain_keywords = {}
-
-        for domain, config in self.DOMAINS.items():
-            matches = [kw for kw in config['keywords'] if kw in request_lower]
-            score = len(matches) / len(config['keywords'])  # Normalized score
-            domain_scores[domain] = score
-            domain_keywords[domain] = matches
-
-        # Get best match
-        if domain_scores and max(domain_scores.values()) > 0:
-            detected_domain = max(domain_scores, key=domain_scores.get)
-            confidence = domain_scores[detected_domain]
-            keywords = domain_keywords[detected_domain]
-            tools = self.DOMAINS[detected_domain]['tools']
+        return [
+            self._classify(request, request_lower, keywords)
+            for request, request_lower, keywords in zip(requests, lowered, found)
+        ]
+
+    def _classify(self, request: str, request_lower: str, found: Set[str]) -> DomainResult:
+        """Score domains and complexity given the keywords found in a request"""
+
+        # Detect domain: count hits per domain slot from the keywords found
+        domains, domain_keywords, sizes, keyword_domains = self._domain_index()
+        counts = [0] * len(domains)
+
+        for kw in found:
+            for i in keyword_domains[kw]:
+                counts[i] += 1
+
+        scores = [count / size for count, size in zip(counts, sizes)]  # Normalized score
+
+        # Get best match (first domain wins ties)
+        best = max(range(len(scores)), key=scores.__getitem__, default=None)
+        if best is not None and scores[best] > 0:
+            detected_domain = domains[best]
+            confidence = scores[best]
+            keywords = tuple(kw for kw in domain_keywords[best] if kw in found)
+            tools = tuple(self.DOMAINS[detected_domain]['tools'])
         else:
             detected_domain = 'General'
             confidence = 1.0
-            keywords = []
-            tools = []
+            keywords = ()
+            tools = ()
 
-        # Detect complexity
+        # Detect complexity: the first indicator present, in level order, decides
         complexity = 3  # Default standard
 
-        for level, indicators in self.COMPLEXITY_INDICATORS.items():
-            if any(ind in request_lower for ind in indicators):
-                if level == 'simple':
-                    complexity = 2
-                elif level == 'complex':
-                    complexity = 5
+        for indicator, level_complexity in self._complexity_table():
+            if indicator in request_lower:
+                complexity = level_complexity
                 break
 
-        # Adjust complexity based on request length
-        if len(request.split()) > 50:
+        # Adjust complexity based on request length; maxsplit stops after word 51
+        if len(request.split(None, 50)) > 50:
             complexity = min(complexity + 1, 5)
 
         return DomainResult(
@@ -142,6 +197,55 @@ class DomainDetector:
             suggested_tools=tools
         )
 
+    @classmethod
+    @functools.cache
+    def _keyword_automaton(cls):
+        """Build the keyword automaton once per class; None without pyahocorasick"""
+        return _build_automaton(cls._domain_index()[3])
+
+    @classmethod
+    @functools.cache
+    def _domain_index(cls) -> tuple:
+        """Build per-domain lookup tables once per class.
+
+        Returns (domains, domain_keywords, sizes, keyword_domains): domain
+        names in DOMAINS order, their keywords lowercased and interned (so
+        every table shares one string per keyword), the keyword count of
+        each, and each keyword's domain slots.
+        """
+        domains = tuple(cls.DOMAINS)
+        domain_keywords = tuple(
+            tuple(sys.intern(kw.lower()) for kw in cls.DOMAINS[domain]['keywords'])
+            for domain in domains
+        )
+        sizes = tuple(len(keywords) for keywords in domain_keywords)
+        keyword_domains: Dict[str, List[int]] = {}
+        for i, keywords in enumerate(domain_keywords):
+            for kw in keywords:
+                keyword_domains.setdefault(kw, []).append(i)
+        return domains, domain_keywords, sizes, keyword_domains
+
+    @classmethod
+    @functools.cache
+    def _complexity_table(cls) -> Tuple[Tuple[str, int], ...]:
+        """Flatten COMPLEXITY_INDICATORS into (indicator, complexity) pairs in level order"""
+        level_complexity = {'simple': 2, 'complex': 5}
+        return tuple(
+            (indicator, level_complexity.get(level, 3))
+            for level, indicators in cls.COMPLEXITY_INDICATORS.items()
+            for indicator in indicators
+        )
+
+    def _find_keywords(self, request_lower: str) -> Set[str]:
+        """Return every domain keyword occurring in the lowercased request"""
+        automaton = self._keyword_automaton()
+
+        if automaton is not None:
+            # Single pass reporting overlapping hits, e.g. both 'deploy' and 'deployment'
+            return {kw for _, kw in automaton.iter(request_lower)}
+
+        return {kw for kw in self._domain_index()[3] if kw in request_lower}
+
     def suggest_mcp_servers(self, domain: str) -> List[Dict[str, str]]:
         """Suggest relevant MCP servers for domain"""
 
@@ -9,13 +9,150 @@ Implements dual-pass prompt refinement:
 Uses prompt-redefiner skill for quality analysis and optimization.
 """
 
+import functools
 import json
 import re
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from collections import Counter, deque
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Tuple
+from dataclasses import asdict, dataclass
+
+try:
+    import orjson
+except ImportError:  # Optional; falls back to stdlib json
+    orjson = None
+
+
+def _to_json(obj: Any) -> str:
+    """Serialize to 2-space indented JSON (dataclasses included), using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=asdict)
+
+
+# Persona detection (from persona-prompt-optimizer); low_knowledge comes first
+# because a hit pins the persona score and ends the scan
+_PERSONA_PATTERNS = (
+    ('low_knowledge', re.compile(r'you are (an? )?(toddler|child|beginner|layperson)')),
+    ('expert', re.compile(r'you are (an? )?(expert|specialist|professional)')),
+    ('role', re.compile(r'you are (an? )?(\w+) (who|that)')),
+    ('stylistic', re.compile(r'(respond|write|speak) (in|like|as)')),
+    ('perspective', re.compile(r'(imagine|pretend|act as if)'))
+)
+_PERSONA_SCORES = {'low_knowledge': 0, 'expert': 25, 'role': 50}
+
+# Union of the persona patterns; most prompts have none, so one scan rules them out
+_PERSONA_ANY_RE = re.compile('|'.join(f'(?:{pattern.pattern})' for _, pattern in _PERSONA_PATTERNS))
+
+# Expert, role and low-knowledge persona lines, stripped in one pass during refinement
+_PERSONA_STRIP_RE = re.compile(
+    r'you are (?:an? )?(?:expert|specialist|professional|\w+ (?:who|that)|toddler|child|beginner|layperson)'
+    r'[^\n]*\n?',
+    re.IGNORECASE
+)
+
+_LIST_TASK_RE = re.compile(r'(list|enumerate|identify all)')
+
+# Section headers, one named group per structural clarity bonus
+_STRUCTURE_RE = re.compile(
+    r'(?P<objective>(?:objective|goal|purpose):)'
+    r'|(?P<criteria>(?:success criteria|requirements|constraints):)'
+    r'|(?P<output>(?:output format|deliverable|result):)',
+    re.IGNORECASE
+)
+_STRUCTURE_BONUS = {'objective': 15, 'criteria': 15, 'output': 10}
+
+# Refinements kept in PromptRefiner.refinement_history; the oldest drop off first
+REFINEMENT_HISTORY_LIMIT = 10_000
+
+
+class _PromptFeatures(NamedTuple):
+    """Pattern hits in a piece of prompt text, as scored by _analyze_prompt"""
+    personas: Tuple[str, ...]
+    mentions_verification: bool
+    list_task: bool
+    headers: FrozenSet[str]
+
+    def merge(self, other: '_PromptFeatures') -> '_PromptFeatures':
+        """Hits of two texts joined by a blank line; no pattern spans a newline"""
+        if 'low_knowledge' in self.personas or 'low_knowledge' in other.personas:
+            personas = ('low_knowledge',)
+        else:
+            personas = tuple(t for t, _ in _PERSONA_PATTERNS if t in self.personas or t in other.personas)
+        return _PromptFeatures(
+            personas,
+            self.mentions_verification or other.mentions_verification,
+            self.list_task or other.list_task,
+            self.headers | other.headers
+        )
+
+
+def _scan_features(text: str) -> _PromptFeatures:
+    """Run every analysis pattern over text once"""
+    text_lower = text.lower()
+
+    personas = []
+    # Skip the per-type checks when the combined pattern finds no persona
+    if _PERSONA_ANY_RE.search(text_lower):
+        for persona_type, pattern in _PERSONA_PATTERNS:
+            if pattern.search(text_lower):
+                personas.append(persona_type)
+                if persona_type == 'low_knowledge':
+                    break  # Harmful; no other persona can change the score
+
+    return _PromptFeatures(
+        personas=tuple(personas),
+        mentions_verification='verify' in text_lower or 'check' in text_lower,
+        list_task=_LIST_TASK_RE.search(text_lower) is not None,
+        headers=frozenset(m.lastgroup for m in _STRUCTURE_RE.finditer(text_lower))
+    )
+
+
+# Agent prompts often share boilerplate and appended blocks are fixed
+# templates, so the same text is scanned repeatedly
+_cached_features = functools.lru_cache(maxsize=256)(_scan_features)
+
+
+@functools.lru_cache(maxsize=32)
+def _components_block(components: Tuple[str, ...]) -> str:
+    """Bullet list of agent components; callers reuse a few fixed component sets"""
+    return '\n'.join(f'- {comp}' for comp in components)
+
+
+# Claude 4.5 / 2025 best-practice blocks for agent prompts, keyed by opening tag
+_2025_BLOCKS = (
+    ('<use_parallel_tool_calls>',
+     "<use_parallel_tool_calls>\nGenerate all independent files in parallel for speed.\n</use_parallel_tool_calls>"),
+    ('<default_to_action>',
+     "<default_to_action>\nGenerate complete implementations immediately. Don't ask for confirmation.\n</default_to_action>"),
+    ('<context_aware_generation>',
+     "<context_aware_generation>\nThis is a comprehensive generation task. Work systematically. Track context budget.\n</context_aware_generation>"),
+    ('<output_format>', """<output_format>
+<generated_workflow>
+  <files>
+    <file path="..." language="...">content</file>
+  </files>
+</generated_workflow>
+</output_format>"""),
+)
+
+# Finds which of those tags a prompt already has in one scan
+_2025_TAG_RE = re.compile('|'.join(re.escape(tag) for tag, _ in _2025_BLOCKS))
 
+# Fixed tail of every agent structure block
+_AGENT_CONSTRAINTS_BLOCK = """CONSTRAINTS:
+- Standard tools only (no custom dependencies unless necessary)
+- Each script under 200 lines
+- Follow 2025 Claude Code best practices
+- Include proper YAML frontmatter
+
+VERIFICATION:
+1. Validate syntax (YAML, JSON, Python)
+2. Check file structure completeness
+3. Verify executable permissions
+"""
 
-@dataclass
+
+@dataclass(slots=True)
 class RefinementResult:
     """Result of prompt refinement"""
     original_prompt: str
@@ -31,8 +168,33 @@ class RefinementResult:
 class PromptRefiner:
     """Dual-pass prompt refinement using prompt-redefiner skill"""
 
+    __slots__ = ('_history', '_phase_counts', '_quality_delta_total', '_improvement_total')
+
     def __init__(self):
-        self.refinement_history = []
+        # Only _record appends, so the running totals below always match it
+        self._history = deque(maxlen=REFINEMENT_HISTORY_LIMIT)
+        # Running totals over the history for get_refinement_summary
+        self._phase_counts = Counter()
+        self._quality_delta_total = 0
+        self._improvement_total = 0
+
+    @property
+    def refinement_history(self) -> List[Dict[str, Any]]:
+        """Recorded refinements, oldest first, as a new list"""
+        return list(self._history)
+
+    def _record(self, entry: Dict[str, Any]) -> None:
+        """Append to the history, keeping the running totals in step with evictions"""
+        if len(self._history) == self._history.maxlen:
+            self._tally(self._history[0], -1)
+        self._history.append(entry)
+        self._tally(entry, 1)
+
+    def _tally(self, entry: Dict[str, Any], sign: int) -> None:
+        result = entry['result']
+        self._phase_counts[entry['phase']] += sign
+        self._quality_delta_total += sign * (result.refined_quality - result.original_quality)
+        self._improvement_total += sign * len(result.improvements)
 
     def refine_user_request(self, request: str) -> RefinementResult:
         """
@@ -68,7 +230,7 @@ class PromptRefiner:
             structural_clarity=refined['structural_clarity']
         )
 
-        self.refinement_history.append({
+        self._record({
             'phase': 'user_request',
             'result': result
         })
@@ -103,34 +265,10 @@ class PromptRefiner:
         refined_prompts = {}
 
         for agent_name, prompt in prompts.items():
-            analysis = self._analyze_prompt(
-                prompt,
-                context="agent_generation",
-                domain=domain
-            )
-
-            refined = self._apply_refinements(
-                prompt,
-                analysis,
-                is_user_request=False,
-                domain=domain,
-                format_config=format_config
-            )
-
-            result = RefinementResult(
-                original_prompt=prompt,
-                refined_prompt=refined['prompt'],
-                original_quality=analysis['overall_quality'],
-                refined_quality=refined['quality'],
-                improvements=refined['improvements'],
-                persona_score=analysis['persona_score'],
-                hallucination_risk=analysis['hallucination_risk'],
-                structural_clarity=refined['structural_clarity']
-            )
-
+            result = self._refine_one(prompt, domain, format_config)
             refined_prompts[agent_name] = result
 
-            self.refinement_history.append({
+            self._record({
                 'phase': 'agent_prompt',
                 'agent': agent_name,
                 'result': result
@@ -138,6 +276,33 @@ class PromptRefiner:
 
         return refined_prompts
 
+    def _refine_one(self, prompt: str, domain: str, format_config: Dict[str, Any]) -> RefinementResult:
+        """Refine a single agent prompt without touching the history"""
+        analysis = self._analyze_prompt(
+            prompt,
+            context="agent_generation",
+            domain=domain
+        )
+
+        refined = self._apply_refinements(
+            prompt,
+            analysis,
+            is_user_request=False,
+            domain=domain,
+            format_config=format_config
+        )
+
+        return RefinementResult(
+            original_prompt=prompt,
+            refined_prompt=refined['prompt'],
+            original_quality=analysis['overall_quality'],
+            refined_quality=refined['quality'],
+            improvements=refined['improvements'],
+            persona_score=analysis['persona_score'],
+            hallucination_risk=analysis['hallucination_risk'],
+            structural_clarity=refined['structural_clarity']
+        )
+
     def _analyze_prompt(
         self,
         prompt: str,
@@ -146,27 +311,14 @@ class PromptRefiner:
     ) -> Dict[str, int]:
         """Analyze prompt quality using prompt-redefiner patterns"""
 
-        # Persona detection (from persona-prompt-optimizer)
-        persona_patterns = {
-            'expert': r'you are (an? )?(expert|specialist|professional)',
-            'role': r'you are (an? )?(\w+) (who|that)',
-            'low_knowledge': r'you are (an? )?(toddler|child|beginner|layperson)',
-            'stylistic': r'(respond|write|speak) (in|like|as)',
-            'perspective': r'(imagine|pretend|act as if)'
-        }
+        return self._score_features(_cached_features(prompt), context)
 
-        persona_score = 100
-        detected_personas = []
+    def _score_features(self, features: _PromptFeatures, context: str) -> Dict[str, Any]:
+        """Turn pattern hits into persona, risk, clarity and overall scores"""
 
-        for persona_type, pattern in persona_patterns.items():
-            if re.search(pattern, prompt.lower()):
-                detected_personas.append(persona_type)
-                if persona_type == 'low_knowledge':
-                    persona_score = 0  # Harmful
-                elif persona_type == 'expert':
-                    persona_score = min(persona_score, 25)  # Ineffective
-                elif persona_type == 'role':
-                    persona_score = min(persona_score, 50)  # Ineffective
+        # Persona detection (from persona-prompt-optimizer)
+        # Worst detected persona wins: low_knowledge is harmful, expert/role ineffective
+        persona_score = min((_PERSONA_SCORES.get(t, 100) for t in features.personas), default=100)
 
         # Hallucination risk assessment (from chain-of-verification)
         hallucination_risk = 50  # Default medium
@@ -179,24 +331,18 @@ class PromptRefiner:
             hallucination_risk = 60
 
         # Check for verification patterns
-        if 'verify' in prompt.lower() or 'check' in prompt.lower():
+        if features.mentions_verification:
             hallucination_risk -= 15
 
         # Check for list-based tasks (high risk)
-        if re.search(r'(list|enumerate|identify all)', prompt.lower()):
+        if features.list_task:
             hallucination_risk += 20
 
         # Structural clarity assessment
         structural_clarity = 50
 
-        if re.search(r'(objective|goal|purpose):', prompt.lower(), re.IGNORECASE):
-            structural_clarity += 15
-
-        if re.search(r'(success criteria|requirements|constraints):', prompt.lower(), re.IGNORECASE):
-            structural_clarity += 15
-
-        if re.search(r'(output format|deliverable|result):', prompt.lower(), re.IGNORECASE):
-            structural_clarity += 10
+        for header in features.headers:
+            structural_clarity += _STRUCTURE_BONUS[header]
 
         # Overall quality (weighted average)
         overall_quality = int(
@@ -210,7 +356,8 @@ class PromptRefiner:
             'hallucination_risk': hallucination_risk,
             'structural_clarity': structural_clarity,
             'overall_quality': overall_quality,
-            'detected_personas': detected_personas
+            'detected_personas': list(features.personas),
+            'features': features
         }
 
     def _apply_refinements(
@@ -219,25 +366,27 @@ class PromptRefiner:
         analysis: Dict[str, int],
         is_user_request: bool,
         domain: str = None,
-        format_config: Dict[str, Any] = None
+        format_config: Dict[str, Any] = None,
+        rescan: bool = False
     ) -> Dict[str, Any]:
-        """Apply refinements based on analysis"""
+        """
+        Apply refinements based on analysis
+
+        The refined prompt is scored from the original pattern hits plus the
+        hits of each appended block; rescan=True re-analyzes the full text.
+        """
 
         refined = prompt
         improvements = []
+        features = analysis['features']
 
         # Remove ineffective personas
         if analysis['persona_score'] < 75:
-            persona_patterns = [
-                (r'you are (an? )?(expert|specialist|professional)[^\n]*\n?', ''),
-                (r'you are (an? )?(\w+) (who|that)[^\n]*\n?', ''),
-                (r'you are (an? )?(toddler|child|beginner|layperson)[^\n]*\n?', '')
-            ]
-
-            for pattern, replacement in persona_patterns:
-                if re.search(pattern, refined, re.IGNORECASE):
-                    refined = re.sub(pattern, replacement, refined, flags=re.IGNORECASE)
-                    improvements.append("Removed ineffective persona")
+            refined, removed = _PERSONA_STRIP_RE.subn('', refined)
+            if removed:
+                improvements.append("Removed ineffective persona")
+                # Lines were removed, so the earlier hits no longer apply
+                features = _scan_features(refined)
 
         # Add structural specifications
         if analysis['structural_clarity'] < 70:
@@ -248,28 +397,45 @@ class PromptRefiner:
                 # Add agent generation structure
                 structural_additions = self._add_agent_structure(refined, domain, format_config)
 
+            features = features.merge(_cached_features(structural_additions[len(refined):]))
             refined = structural_additions
             improvements.append("Added structural specifications")
 
+        # Lowercased once and extended with each appended block it must reflect
+        refined_lower = refined.lower()
+
+        # Blocks appended after the prompt, joined in one pass
+        tail = []
+
         # Add success criteria
-        if 'success' not in refined.lower():
+        if 'success' not in refined_lower:
             success_criteria = self._generate_success_criteria(refined, is_user_request, domain)
-            refined += f"\n\n{success_criteria}"
+            tail.append(success_criteria)
+            refined_lower += f"\n\n{success_criteria.lower()}"
             improvements.append("Defined success criteria")
 
         # Add verification protocol for high-risk tasks
-        if analysis['hallucination_risk'] > 60 and 'verify' not in refined.lower():
-            verification = self._add_verification_protocol(refined, is_user_request)
-            refined += f"\n\n{verification}"
+        if analysis['hallucination_risk'] > 60 and 'verify' not in refined_lower:
+            tail.append(self._add_verification_protocol(refined, is_user_request))
             improvements.append("Added verification protocol")
 
+        if tail:
+            refined = '\n\n'.join([refined, *tail])
+            for block in tail:
+                features = features.merge(_cached_features(block))
+
         # Add 2025 patterns for agent prompts
         if not is_user_request:
-            refined = self._add_2025_patterns(refined, domain)
+            with_patterns = self._add_2025_patterns(refined, domain)
+            features = features.merge(_cached_features(with_patterns[len(refined):]))
+            refined = with_patterns
             improvements.append("Added 2025 best practices (parallel tools, XML, explicit)")
 
         # Recalculate quality
-        new_analysis = self._analyze_prompt(refined, 'refined')
+        if rescan:
+            new_analysis = self._analyze_prompt(refined, 'refined')
+        else:
+            new_analysis = self._score_features(features, 'refined')
 
         return {
             'prompt': refined.strip(),
@@ -317,19 +483,9 @@ OBJECTIVE:
 Generate production-ready {domain or 'workflow'} implementation
 
 COMPONENTS:
-{chr(10).join(f'- {comp}' for comp in components)}
+{_components_block(tuple(components))}
 
-CONSTRAINTS:
-- Standard tools only (no custom dependencies unless necessary)
-- Each script under 200 lines
-- Follow 2025 Claude Code best practices
-- Include proper YAML frontmatter
-
-VERIFICATION:
-1. Validate syntax (YAML, JSON, Python)
-2. Check file structure completeness
-3. Verify executable permissions
-"""
+{_AGENT_CONSTRAINTS_BLOCK}"""
 
     def _generate_success_criteria(
         self,
@@ -371,44 +527,20 @@ VERIFICATION:
     def _add_2025_patterns(self, prompt: str, domain: str) -> str:
         """Add Claude 4.5 and 2025 best practices"""
 
-        if '<use_parallel_tool_calls>' not in prompt:
-            prompt += "\n\n<use_parallel_tool_calls>\nGenerate all independent files in parallel for speed.\n</use_parallel_tool_calls>"
-
-        if '<default_to_action>' not in prompt:
-            prompt += "\n\n<default_to_action>\nGenerate complete implementations immediately. Don't ask for confirmation.\n</default_to_action>"
-
-        if '<context_aware_generation>' not in prompt:
-            prompt += "\n\n<context_aware_generation>\nThis is a comprehensive generation task. Work systematically. Track context budget.\n</context_aware_generation>"
-
-        if not re.search(r'<output_format>', prompt):
-            prompt += """\n\n<output_format>
-<generated_workflow>
-  <files>
-    <file path="..." language="...">content</file>
-  </files>
-</generated_workflow>
-</output_format>"""
-
-        return prompt
+        present = set(_2025_TAG_RE.findall(prompt))
+        return '\n\n'.join([prompt, *(block for tag, block in _2025_BLOCKS if tag not in present)])
 
     def get_refinement_summary(self) -> Dict[str, Any]:
         """Get summary of all refinements performed"""
 
-        user_refinements = [h for h in self.refinement_history if h['phase'] == 'user_request']
-        agent_refinements = [h for h in self.refinement_history if h['phase'] == 'agent_prompt']
+        history = self._history
 
         return {
-            'total_refinements': len(self.refinement_history),
-            'user_request_refinements': len(user_refinements),
-            'agent_prompt_refinements': len(agent_refinements),
-            'avg_quality_improvement': sum(
-                h['result'].refined_quality - h['result'].original_quality
-                for h in self.refinement_history
-            ) / len(self.refinement_history) if self.refinement_history else 0,
-            'total_improvements': sum(
-                len(h['result'].improvements)
-                for h in self.refinement_history
-            )
+            'total_refinements': len(history),
+            'user_request_refinements': self._phase_counts['user_request'],
+            'agent_prompt_refinements': self._phase_counts['agent_prompt'],
+            'avg_quality_improvement': self._quality_delta_total / len(history) if history else 0,
+            'total_improvements': self._improvement_total
         }
 
 
@@ -454,4 +586,4 @@ if __name__ == '__main__':
     print("\n" + "=" * 60)
     print("REFINEMENT SUMMARY")
     print("=" * 60)
-    print(json.dumps(summary, indent=2))
+    print(_to_json(summary))